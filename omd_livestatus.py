@@ -17,6 +17,30 @@ environment via
 
 or on the command-line with --socket.
 
+The inventory is cached for 60 seconds so that repeated invocations by
+Ansible don't have to query Livestatus every time.  The cache file is
+
+    ${OMD_ROOT}/tmp/omd_livestatus_inv.json
+
+for OMD site users and
+
+    ${XDG_CACHE_HOME:-~/.cache}/omd_livestatus_inv.json
+
+otherwise.  A cache file that is not owned by the current user or that
+is writable by others is ignored.  Cache file and maximum age in seconds
+can be set from the environment via
+
+    export OMD_LIVESTATUS_CACHE=/path/to/cache.json
+    export OMD_LIVESTATUS_CACHE_TTL=300
+
+or the maximum age on the command-line with --cache-max-age.  A maximum
+age of 0 disables the cache.
+
+The hostvars in `_meta` of the --list output are authoritative, so
+Ansible never has to call the script with --host.  Therefore --host
+returns an empty result right away unless --enable-host is given, e.g.
+for debugging.
+
 
 Inspired by the DigitalOcean inventory script:
 https://github.com/ansible/ansible/blob/devel/contrib/inventory/digital_ocean.py
@@ -28,12 +52,13 @@ from __future__ import print_function
 
 __version__ = '0.2'
 
-import datetime
 import os
 import sys
-import optparse                         # Legacy ... 2.6 still out there
 import socket
-import subprocess
+import stat
+import tempfile
+import time
+from collections import defaultdict
 
 try:
     import json
@@ -41,9 +66,54 @@ except ImportError:
     import simplejson as json
 
 try:
-    maketrans = str.maketrans           # Python 3
-except AttributeError:
-    from string import maketrans        # Python 2
+    import orjson                       # Optional, but much faster
+except ImportError:
+    orjson = None
+
+
+#: positions of the Livestatus query columns in a host row
+_IP, _NAME, _ALIAS, _GROUPS, _CUSTOM_VARS = range(5)
+
+
+def _loads(data):
+    """Decode JSON from bytes, using orjson if available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    try:
+        return json.loads(data)
+    except TypeError:
+        # json only accepts bytes as of Python 3.6 and no bytearray on
+        # Python 2.
+        return json.loads(bytes(data).decode('utf-8'))
+
+
+def _dumps(obj, indent=None, sort_keys=False):
+    """Encode JSON, using orjson if available.
+
+    Without `indent` the most compact form is returned.  orjson only
+    supports an indentation of two spaces, so any `indent` is treated
+    as a flag in that case.  Non-ASCII characters are never escaped,
+    just like orjson does it, so write the result as UTF-8.
+
+    """
+    if orjson is not None:
+        option = 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option).decode('utf-8')
+    if indent is None:
+        return json.dumps(obj, separators=(',', ':'), sort_keys=sort_keys,
+                          ensure_ascii=False)
+    return json.dumps(obj, indent=indent, separators=(',', ': '),
+                      sort_keys=sort_keys, ensure_ascii=False)
+
+
+def _print(text):
+    """Print `text` as UTF-8, independent of the encoding of stdout."""
+    stdout = getattr(sys.stdout, 'buffer', sys.stdout)
+    stdout.write(text.encode('utf-8') + b'\n')
 
 
 class OMDLivestatusInventory(object):
@@ -56,30 +126,47 @@ class OMDLivestatusInventory(object):
         'Columns: address name alias groups host_custom_variables\n'
         'OutputFormat: json\n')
 
+    #: default cache path for OMD site users
+    _def_site_cache_path = u'/tmp/omd_livestatus_inv.json'
+
+    #: default cache file name otherwise, created in the user's cache
+    #: directory
+    _def_cache_file = u'omd_livestatus_inv.json'
+
+    #: default maximum age of the cache in seconds
+    _def_cache_ttl = 60
+
+    #: headers to get the status and length of the answer up front
+    _response_headers = (b'ResponseHeader: fixed16\n'
+        b'\n')
+
+    #: minimum number of bytes to wait for when reading the socket
+    _recv_lowat = 16384
+
     #: string of bad characters in host or group names
     _bad_chars = u'.,;:[]/ '
 
     #: replacement char for bad chars
     _replacement_char = u'_'
 
-    def __init__(self, location=None, method='socket', by_ip=False):
-        self.data = {}
-        self.inventory = {}
+    #: translation table for sanitizing group names
+    #
+    # Built once per class.  A comprehension can't be used here since it
+    # doesn't see class variables, see:
+    # http://stackoverflow.com/questions/13905741/accessing-class-variables-from-a-list-comprehension-in-the-class-definition
+    #
+    # Group names are unicode, hence the dict instead of a byte table:
+    # http://stackoverflow.com/questions/1324067/how-do-i-get-str-translate-to-work-with-unicode-strings
+    _trans_table = dict.fromkeys(map(ord, _bad_chars), _replacement_char)
+
+    def __init__(self, location=None, method='socket', by_ip=False,
+                 host=None, cache_ttl=None):
+        #: group name -> list of hosts
+        self._groups = {}
+        #: host -> dict of host variables
+        self._hostvars = {}
         self.method = method
-
-        #: translation table for sanitizing group names
-        #
-        # See the following to find out why this can't be a class variable:
-        # http://stackoverflow.com/questions/13905741/accessing-class-variables-from-a-list-comprehension-in-the-class-definition
-
-        # This version only works for byte strings but not for unicode :-(
-        #self._trans_table = maketrans(
-        #    self._bad_chars, self._replacement_char * len(_bad_chars))
-
-        # Unicode version; see also:
-        # http://stackoverflow.com/questions/1324067/how-do-i-get-str-translate-to-work-with-unicode-strings
-        self._trans_table = dict((ord(char), self._replacement_char)
-                                 for char in self._bad_chars)
+        self.by_ip = by_ip
 
         if not location:
             if 'OMD_LIVESTATUS_SOCKET' in os.environ:
@@ -93,38 +180,167 @@ class OMDLivestatusInventory(object):
         else:
             self.location = location
 
-        self.load_from_omd()
+        if 'OMD_LIVESTATUS_CACHE' in os.environ:
+            self.cache_path = os.environ['OMD_LIVESTATUS_CACHE']
+        elif 'OMD_ROOT' in os.environ:
+            self.cache_path = (os.environ['OMD_ROOT']
+                               + OMDLivestatusInventory._def_site_cache_path)
+        else:
+            cache_dir = (os.environ.get('XDG_CACHE_HOME')
+                         or os.path.join(os.path.expanduser('~'), '.cache'))
+            self.cache_path = os.path.join(
+                cache_dir, OMDLivestatusInventory._def_cache_file)
+
+        if cache_ttl is None:
+            cache_ttl = os.environ.get('OMD_LIVESTATUS_CACHE_TTL',
+                                       OMDLivestatusInventory._def_cache_ttl)
+        self.cache_ttl = int(cache_ttl)
+        # The cache is only valid for the same data source and layout.
+        self._cache_key = [self.method, self.location, by_ip]
+
+        if self.load_from_cache():
+            return
+        hosts = self.load_from_omd(host)
         if by_ip:
-            self.build_inventory_by_ip()
+            self.build_inventory_by_ip(hosts)
         else:
-            self.build_inventory_by_name()
+            self.build_inventory_by_name(hosts)
+        # Never cache the partial inventory of a single host.
+        if host is None:
+            self.save_to_cache()
+
+    def load_from_cache(self):
+        """Read inventory from the cache file if it is fresh enough.
+
+        Returns True if the inventory was populated from the cache,
+        False if the cache is disabled, stale, unreadable or belongs to
+        a different Livestatus location.  Files not owned by the current
+        user or writable by group or others are never trusted.
 
-    def load_from_omd(self):
+        """
+        if self.cache_ttl <= 0:
+            return False
+        try:
+            with open(self.cache_path, 'rb') as f:
+                st = os.fstat(f.fileno())
+                if (st.st_uid != os.getuid()
+                        or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)):
+                    return False
+                if time.time() - st.st_mtime > self.cache_ttl:
+                    return False
+                cache = _loads(f.read())
+            # Indexing anything but a dict raises TypeError.
+            if cache['key'] != self._cache_key:
+                return False
+            groups, hostvars = cache['groups'], cache['hostvars']
+            if not (isinstance(groups, dict) and isinstance(hostvars, dict)):
+                return False
+            self._groups = groups
+            self._hostvars = hostvars
+        except (IOError, OSError, ValueError, KeyError, TypeError):
+            return False
+        return True
+
+    def save_to_cache(self):
+        """Write inventory to the cache file.
+
+        The file is written under a temporary name and renamed into
+        place, so concurrent runs never see partial data.  Failing to
+        write the cache is not an error, but is reported on stderr.
+
+        """
+        if self.cache_ttl <= 0:
+            return
+        cache = {
+            'key': self._cache_key,
+            'groups': self._groups,
+            'hostvars': self._hostvars,
+        }
+        cache_dir = os.path.dirname(os.path.abspath(self.cache_path))
+        try:
+            if not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir, 0o700)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+        except (IOError, OSError) as e:
+            print(u'Cannot write cache file {0}: {1}'.format(
+                self.cache_path, e), file=sys.stderr)
+            return
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_dumps(cache).encode('utf-8'))
+            os.rename(tmp_path, self.cache_path)
+        except (IOError, OSError) as e:
+            os.unlink(tmp_path)
+            print(u'Cannot write cache file {0}: {1}'.format(
+                self.cache_path, e), file=sys.stderr)
+
+    def load_from_omd(self, host=None):
         """Read host data from livestatus socket.
 
-        Populates self.data['hosts'].
+        Returns one (ip, name, alias, groups, custom_vars) row per host,
+        see _IP, _NAME, etc.  If `host` is given, only rows for this
+        host name (or IP address if building the inventory by IP) are
+        requested from Livestatus.
 
         """
-        self.data['hosts'] = []
+        query = OMDLivestatusInventory._def_host_query
+        if host is not None:
+            if '\n' in host:
+                raise ValueError('Invalid host: {0!r}'.format(host))
+            query += u'Filter: {0} = {1}\n'.format(
+                'address' if self.by_ip else 'name', host)
+        query = query.encode('utf-8')
+        # Rows are used as returned by Livestatus, i.e. in the order of
+        # the query columns, instead of creating a dict for every host.
         if self.method == 'ssh':
-            answer = json.loads(self._read_from_ssh())
-        else:
-            answer = json.loads(self._read_from_socket())
+            return _loads(self._read_from_ssh(query))
+        return _loads(self._read_from_socket(query))
+
+    def _read_from_socket(self, query):
+        """Read data from local Livestatus socket.
 
-        for host in answer:
-            self.data['hosts'].append(
-                dict(zip((u'ip', u'name', u'alias', u'groups', u'custom_vars'),
-                         host)))
+        The socket is closed as soon as the answer has been read.
 
-    def _read_from_socket(self):
-        """Read data from local Livestatus socket."""
+        """
         s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        s.connect(self.location)
-        s.send(OMDLivestatusInventory._def_host_query.encode('utf-8'))
-        s.shutdown(socket.SHUT_WR)
-        return s.recv(100000000).decode('utf-8')
+        try:
+            s.connect(self.location)
+            # Wake up for larger batches instead of every few bytes.  As
+            # _recv_exactly() never asks for more than is still missing,
+            # this can't block on the tail of an answer.
+            try:
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVLOWAT,
+                             OMDLivestatusInventory._recv_lowat)
+            except (AttributeError, socket.error):
+                pass
+            s.sendall(query + OMDLivestatusInventory._response_headers)
+            # The fixed16 header tells us the exact length of the answer.
+            header = bytes(self._recv_exactly(s, 16))
+            status, length = int(header[:3]), int(header[4:15])
+            answer = self._recv_exactly(s, length)
+        finally:
+            s.close()
+        if status != 200:
+            raise RuntimeError(bytes(answer))
+        return answer
+
+    def _recv_exactly(self, s, length):
+        """Read exactly `length` bytes from the Livestatus socket `s`.
+
+        Data is received directly into a single preallocated buffer.
 
-    def _read_from_ssh(self):
+        """
+        buf = bytearray(length)
+        view = memoryview(buf)
+        received = 0
+        while received < length:
+            n = s.recv_into(view[received:], length - received)
+            if not n:
+                raise IOError('Livestatus closed the connection.')
+            received += n
+        return buf
+
+    def _read_from_ssh(self, query):
         """Read data from remote Livestatus socket via SSH.
 
         Assumes non-interactive (e.g. via ssh-agent) access to the
@@ -135,6 +351,7 @@ class OMDLivestatusInventory(object):
         l = self.location.split(':', 1)
         l.append('.' + OMDLivestatusInventory._def_socket_path)
         host, path = l[0], l[1]
+        import subprocess
         cmd = ['ssh', host,
                '-o', 'BatchMode=yes',
                '-o', 'ConnectTimeout=10',
@@ -143,13 +360,12 @@ class OMDLivestatusInventory(object):
                              stdin=subprocess.PIPE,
                              stdout=subprocess.PIPE,
                              stderr=subprocess.PIPE)
-        out, err = p.communicate(
-            input=OMDLivestatusInventory._def_host_query.encode('utf-8'))
+        out, err = p.communicate(input=query)
         if p.returncode:
             raise RuntimeError(err)
-        return out.decode('utf-8')
+        return out
 
-    def build_inventory_by_ip(self):
+    def build_inventory_by_ip(self, hosts):
         """Create Ansible inventory by IP address instead of by name.
 
         Cave: contrary to hostnames IP addresses are not guaranteed to
@@ -164,33 +380,9 @@ class OMDLivestatusInventory(object):
         contain blanks!
 
         """
-        inventory = {}
-        hostvars = {}
-        for host in self.data['hosts']:
-            for group in host['groups'] or [u'_NOGROUP']:
-                sanitized_group = group.translate(self._trans_table)
-                if sanitized_group in inventory:
-                    inventory[sanitized_group].append(host['ip'])
-                else:
-                    inventory[sanitized_group] = [host['ip']]
-            # Detect duplicate IPs in inventory.  Keep first occurence
-            # in hostvars instead of overwriting with later data.
-            ip = host['ip']
-            if ip not in hostvars:
-                hostvars[ip] = {
-                    'omd_name': host['name'],
-                    'omd_alias': host['alias'],
-                    'omd_custom_vars': host['custom_vars'],
-                }
-            #else:
-            #    # duplicate IP
-            #    pass
-        self.inventory = inventory
-        self.inventory['_meta'] = {
-            'hostvars': hostvars
-        }
+        self._build_inventory(hosts, _IP, _NAME, 'omd_name')
 
-    def build_inventory_by_name(self):
+    def build_inventory_by_name(self, hosts):
         """Create Ansible inventory by OMD name.
 
         Group names are sanitized to not contain characters that Ansible
@@ -198,34 +390,60 @@ class OMDLivestatusInventory(object):
         contain blanks!
 
         """
-        inventory = {}
-        hostvars = {}
-        for host in self.data['hosts']:
-            for group in host['groups'] or [u'_NOGROUP']:
-                sanitized_group = group.translate(self._trans_table)
-                if sanitized_group in inventory:
-                    inventory[sanitized_group].append(host['name'])
-                else:
-                    inventory[sanitized_group] = [host['name']]
-            hostvars[host['name']] = {
-                'ansible_host': host['ip'],
-                'omd_alias': host['alias'],
-                'omd_custom_vars': host['custom_vars'],
+        self._build_inventory(hosts, _NAME, _IP, 'ansible_host')
+
+    def _build_inventory(self, hosts, key_idx, other_idx, other_var):
+        """Create Ansible inventory keyed by column `key_idx`.
+
+        `hosts` are the rows as returned by load_from_omd().  The value
+        of column `other_idx` ends up in the hostvars as `other_var`.
+        If the key is not unique, the first host wins.
+
+        """
+        inventory = defaultdict(list)
+        # There are far fewer distinct groups than host/group pairs.
+        sanitized = {}
+        trans_table = self._trans_table
+        for host in hosts:
+            key = host[key_idx]
+            for group in host[_GROUPS] or (u'_NOGROUP',):
+                sanitized_group = sanitized.get(group)
+                if sanitized_group is None:
+                    sanitized_group = group.translate(trans_table)
+                    sanitized[group] = sanitized_group
+                inventory[sanitized_group].append(key)
+        # Walk the hosts backwards so that for duplicate keys the first
+        # occurence ends up in hostvars instead of later data.
+        hostvars = {
+            host[key_idx]: {
+                other_var: host[other_idx],
+                'omd_alias': host[_ALIAS],
+                'omd_custom_vars': host[_CUSTOM_VARS],
             }
-        self.inventory = inventory
-        self.inventory['_meta'] = {
-            'hostvars': hostvars
+            for host in reversed(hosts)
+        }
+        self._groups = dict(inventory)
+        self._hostvars = hostvars
+
+    @property
+    def inventory(self):
+        """Inventory in the structure expected by Ansible."""
+        inventory = dict(self._groups)
+        inventory['_meta'] = {
+            'hostvars': self._hostvars
         }
+        return inventory
 
     def list(self, indent=None, sort_keys=False):
         """Return full inventory data as JSON."""
-        return json.dumps(self.inventory, indent=indent, sort_keys=sort_keys)
+        return _dumps(self.inventory, indent=indent, sort_keys=sort_keys)
 
     def host(self, name, indent=None, sort_keys=False):
         """Return hostvars for a single host as JSON."""
-        if name in self.inventory['_meta']['hostvars']:
-            return(json.dumps(
-                self.inventory['_meta']['hostvars'][name],
+        hostvars = self._hostvars
+        if name in hostvars:
+            return(_dumps(
+                hostvars[name],
                 indent=indent,
                 sort_keys=sort_keys
             ))
@@ -234,76 +452,131 @@ class OMDLivestatusInventory(object):
 
     def static(self):
         """Return data in static inventory format."""
-        out = []
-        out.append('# File created: {}'.format(datetime.datetime.now()))
-        for group in [k for k in self.inventory.keys() if k != '_meta']:
-            out.append('\n[{0}]'.format(group))
-            for host in self.inventory[group]:
-                vars = self.inventory['_meta']['hostvars'][host]
-                hostvars = []
-                for varname in vars.keys():
-                    hostvars.append('{0}="{1}"'.format(varname, vars[varname]))
-                out.append('{0}\t{1}'.format(host, ' '.join(hostvars)))
+        import datetime
+        hostvars = self._hostvars
+        # Hosts in several groups get the same line in each of them.
+        lines = {}
+        out = ['# File created: %s' % datetime.datetime.now()]
+        for group, hosts in self._groups.items():
+            out.append('\n[%s]' % group)
+            for host in hosts:
+                line = lines.get(host)
+                if line is None:
+                    line = lines[host] = '%s\t%s' % (host, ' '.join(
+                        ['%s="%s"' % item for item in hostvars[host].items()]))
+                out.append(line)
         return '\n'.join(out)
 
 
-def _save_method(option, opt_str, value, parser):
-    parser.values.method = opt_str.lstrip('-')
-    parser.values.location = value
+class _FastOptions(object):
+    """Options for the common invocations, see parse_arguments()."""
+    list = False
+    host = None
+    static = False
+    pretty = False
+    by_ip = False
+    enable_host = False
+    method = 'socket'
+    location = None
+    cache_max_age = None
+
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
 
 
 def parse_arguments():
-    """Parse command line arguments."""
-    parser = optparse.OptionParser(version='%prog {0}'.format(__version__))
-    parser.set_defaults(method='socket')
+    """Parse command line arguments.
 
-    output_group = optparse.OptionGroup(parser, 'Output formats')
-    output_group.add_option(
+    The plain `--list` and `--host HOST` calls made by Ansible are
+    handled without importing and setting up argparse.
+
+    """
+    argv = sys.argv[1:]
+    if argv in ([], ['--list']):
+        return _FastOptions(list=True)
+    if len(argv) == 2 and argv[0] == '--host':
+        return _FastOptions(host=argv[1])
+
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--version', action='version',
+                        version='%(prog)s {0}'.format(__version__))
+
+    output_group = parser.add_argument_group('Output formats')
+    output_group.add_argument(
         '--list', action='store_true', dest='list', default=False,
         help='Return full Ansible inventory as JSON (default action).')
-    output_group.add_option(
-        '--host', type='string', dest='host', default=None,
-        help='Return Ansible hostvars for HOST as JSON.')
-    output_group.add_option(
+    output_group.add_argument(
+        '--host', dest='host', default=None,
+        help=('Return Ansible hostvars for HOST as JSON.  Always empty '
+              'unless --enable-host is given.'
+        ))
+    output_group.add_argument(
+        '--enable-host', action='store_true', dest='enable_host',
+        default=False,
+        help='Really look up HOST for --host instead of returning {}.')
+    output_group.add_argument(
         '--static', action='store_true', dest='static', default=False,
         help='Print inventory in static file format to stdout.')
-    output_group.add_option(
+    output_group.add_argument(
+        '--pretty', action='store_true', dest='pretty', default=False,
+        help='Indent JSON output and sort keys for human readers.')
+    output_group.add_argument(
         '--by-ip', action='store_true', dest='by_ip', default=False,
         help='Create inventory by IP (instead of the default by name).')
-    parser.add_option_group(output_group)
 
-    connect_group = optparse.OptionGroup(parser, 'Connection options')
-    connect_group.add_option(
-        '--socket', type='string', dest='location', default=None,
-        action='callback', callback=_save_method,
+    connect_group = parser.add_argument_group('Connection options')
+    location_group = connect_group.add_mutually_exclusive_group()
+    location_group.add_argument(
+        '--socket', dest='socket', default=None, metavar='LOCATION',
         help=('Set path to Livestatus socket.  If omitted, try to use '
               '$OMD_LIVESTATUS_SOCKET or $OMD_ROOT/tmp/run/live.'
         ))
-    connect_group.add_option(
-        '--ssh', type='string', dest='location', default=None,
-        action='callback', callback=_save_method,
+    location_group.add_argument(
+        '--ssh', dest='ssh', default=None, metavar='LOCATION',
         help=('Connect to Livestatus socket via SSH.  LOCATION has the '
               'form [user@]host[:path], the default path is ./tmp/run/live.'
         ))
-    parser.add_option_group(connect_group)
+    connect_group.add_argument(
+        '--cache-max-age', type=int, dest='cache_max_age', default=None,
+        metavar='SECONDS',
+        help=('Reuse cached inventory data up to this age; 0 disables the '
+              'cache.  If omitted, use $OMD_LIVESTATUS_CACHE_TTL or 60.'
+        ))
 
-    opts, args = parser.parse_args()
+    opts = parser.parse_args(argv)
+    if opts.ssh:
+        opts.method, opts.location = 'ssh', opts.ssh
+    else:
+        opts.method, opts.location = 'socket', opts.socket
     # Make `list` the default action.
     if not opts.host:
         opts.list = True
-    return opts, args
+    return opts
 
 if __name__ == '__main__':
-    opts, args = parse_arguments()
+    opts = parse_arguments()
+    # Ansible takes hostvars from _meta in the --list output and never
+    # needs --host, so don't bother Livestatus for it.
+    if opts.host and not (opts.list or opts.static or opts.enable_host):
+        _print('{}')
+        sys.exit(0)
+    # A plain --host lookup only needs data for that single host.
+    single_host = None if opts.list or opts.static else opts.host
     inv = OMDLivestatusInventory(opts.location,
                                  method=opts.method,
-                                 by_ip=opts.by_ip)
+                                 by_ip=opts.by_ip,
+                                 host=single_host,
+                                 cache_ttl=opts.cache_max_age)
+    # Ansible neither needs indentation nor sorted keys.  Two spaces is
+    # the only indentation orjson supports.
+    indent = 2 if opts.pretty else None
     if opts.static:
-        print(inv.static())
+        _print(inv.static())
     elif opts.list:
-        print(inv.list(indent=4, sort_keys=True))
+        _print(inv.list(indent=indent, sort_keys=opts.pretty))
     elif opts.host:
-        print(inv.host(opts.host, indent=4, sort_keys=True))
+        _print(inv.host(opts.host, indent=indent, sort_keys=opts.pretty))
     else:
         print('Missing command.')
         sys.exit(1)